@@ -4,21 +4,26 @@ from __future__ import annotations
 import logging
 import signal
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from dateutil import tz
 
-from .config import AppConfig, ConfigManager
+from .config import AgendaSettings, AppConfig, ConfigManager, MarketSettings, NewsSettings
 from .display.driver import DisplayDriver
 from .display.layout import LayoutManager
-from .widgets.base import WidgetContext
+from .widgets.base import Widget, WidgetContext
 from .widgets.factory import build_widgets
-from .web.server import launch_config_server
+from .web import launch_config_server
 
 _LOGGER = logging.getLogger(__name__)
 
+# One worker per built-in widget so a slow feed never delays the others.
+_FETCH_WORKERS = 3
+
 
 class SmartDisplayApp:
     """Orchestrates configuration, data fetching, and rendering."""
@@ -29,6 +34,13 @@ class SmartDisplayApp:
         self._stop_event = threading.Event()
         self._web_thread: Optional[threading.Thread] = None
         self._display: Optional[DisplayDriver] = None
+        self._layout: Optional[LayoutManager] = None
+        self._widgets: Dict[str, Widget] = {}
+        self._widget_settings: Optional[Tuple[AgendaSettings, NewsSettings, MarketSettings]] = None
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=_FETCH_WORKERS,
+            thread_name_prefix="smart-display-fetch",
+        )
 
     def run(self) -> None:
         """Enter the refresh loop until interrupted."""
@@ -38,12 +50,16 @@ class SmartDisplayApp:
         signal.signal(signal.SIGINT, lambda *_: self.stop())
 
         while not self._stop_event.is_set():
+            cycle_started = time.monotonic()
             config = self.config_manager.load()
             self._ensure_display(config)
+            self._ensure_layout(config)
+            self._ensure_widgets(config)
             self._ensure_web_server(config)
             self._render_once(config)
-            self._wait_for_next_cycle(config)
+            self._wait_for_next_cycle(config, cycle_started)
 
+        self._fetch_executor.shutdown(wait=False)
         _LOGGER.info("SmartDisplayApp stopped")
 
     def request_refresh(self) -> None:
@@ -61,6 +77,17 @@ class SmartDisplayApp:
         if self._display is None or self._display.settings != config.display:
             self._display = DisplayDriver(config.display)
 
+    def _ensure_layout(self, config: AppConfig) -> None:
+        if self._layout is None or self._layout.settings != config.display:
+            self._layout = LayoutManager(config.display)
+
+    def _ensure_widgets(self, config: AppConfig) -> None:
+        # Widgets keep their last good data, so only rebuild them when their settings change.
+        widget_settings = (config.agenda, config.news, config.market)
+        if self._widget_settings != widget_settings:
+            self._widgets = build_widgets(config)
+            self._widget_settings = widget_settings
+
     def _ensure_web_server(self, config: AppConfig) -> None:
         if not config.web.enabled or self._web_thread is not None:
             return
@@ -72,19 +99,26 @@ class SmartDisplayApp:
 
     def _render_once(self, config: AppConfig) -> None:
         assert self._display is not None
-        layout = LayoutManager(config.display)
+        assert self._layout is not None
+        layout = self._layout
         canvas = layout.canvas()
         now = datetime.now(tz=tz.tzlocal())
-        widgets = build_widgets(config)
-        for widget_id, widget in widgets.items():
+        # Feeds are independent network calls; fetch them concurrently, then draw in order.
+        pending = {
+            widget_id: self._fetch_executor.submit(widget.refresh)
+            for widget_id, widget in self._widgets.items()
+        }
+        for widget_id, widget in self._widgets.items():
+            data = pending[widget_id].result()
             area = layout.area(widget_id)
             context = WidgetContext(area=area, palette=layout.palette, now=now)
-            widget.render(canvas, context)
+            widget.render_data(canvas, context, data)
         self._display.show(canvas)
 
-    def _wait_for_next_cycle(self, config: AppConfig) -> None:
-        wait_seconds = max(config.refresh_minutes, 1) * 60
-        self._refresh_event.wait(wait_seconds)
+    def _wait_for_next_cycle(self, config: AppConfig, cycle_started: float) -> None:
+        interval = max(config.refresh_minutes, 1) * 60
+        elapsed = time.monotonic() - cycle_started
+        self._refresh_event.wait(max(interval - elapsed, 0))
         self._refresh_event.clear()
 
 
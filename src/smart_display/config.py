@@ -1,11 +1,12 @@
 """Configuration management for the Smart Display application."""
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, MutableMapping
+from typing import Any, Dict, MutableMapping, Optional, Tuple
 
 
 @dataclass
@@ -83,13 +84,18 @@ class ConfigManager:
     def __init__(self, path: Path | str = Path("config/config.json")) -> None:
         self.path = Path(path)
         self._lock = Lock()
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
 
     def load(self) -> AppConfig:
         """Load configuration from disk, creating defaults when absent."""
 
+        # Fast path: an unchanged file needs neither the lock nor a parse.
+        cached = self._cache
+        if cached is not None and cached[0] == self._file_signature():
+            return _build_config(cached[1])
         with self._lock:
             data = self._load_unlocked_dict()
-            return _build_config(data)
+        return _build_config(data)
 
     def load_dict(self) -> Dict[str, Any]:
         """Load configuration and return it as a plain dictionary."""
@@ -106,22 +112,42 @@ class ConfigManager:
         """Apply a patch to the configuration and persist it."""
 
         with self._lock:
-            data = self._load_unlocked_dict()
+            current = self._load_unlocked_dict()
+            data = copy.deepcopy(current)
             _deep_update(data, patch)
             config = _build_config(data)
-            self._write_unlocked(config)
+            if config != _build_config(current):
+                self._write_unlocked(config)
             return config
 
     def _load_unlocked_dict(self) -> Dict[str, Any]:
-        if not self.path.exists():
+        """Return the parsed file, reusing the last parse while the file is unchanged.
+
+        The returned mapping is shared with the cache and must not be mutated.
+        """
+
+        signature = self._file_signature()
+        if signature is None:
             default = AppConfig()
             self._write_unlocked(default)
             return asdict(default)
-        return json.loads(self.path.read_text(encoding="utf-8"))
+        if self._cache is not None and self._cache[0] == signature:
+            return self._cache[1]
+        data = json.loads(self.path.read_bytes())
+        self._cache = (signature, data)
+        return data
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     def _write_unlocked(self, config: AppConfig) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.path.write_text(json.dumps(asdict(config), indent=2), encoding="utf-8")
+        self._cache = None
 
 
 def _deep_update(base: MutableMapping[str, Any], updates: MutableMapping[str, Any]) -> None:
@@ -1,18 +1,23 @@
 """Data provider for agenda events."""
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List
+from http import HTTPStatus
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from dateutil import tz
-from ics import Calendar
 
 from ..config import AgendaSettings, CalendarSource
+from .http import session
 
+_LOCAL_TZ = tz.tzlocal()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AgendaEvent:
     """An individual agenda entry."""
 
@@ -22,22 +27,34 @@ class AgendaEvent:
     location: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedFeed:
+    """Parsed events of a calendar feed plus the validators to revalidate it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    events: Tuple[AgendaEvent, ...]
+
+
 class AgendaDataProvider:
     """Fetch agenda entries from configured calendars."""
 
     def __init__(self, settings: AgendaSettings) -> None:
         self.settings = settings
+        self._feeds: Dict[str, _CachedFeed] = {}
 
     def fetch(self) -> List[AgendaEvent]:
-        now = datetime.now(tz.tzlocal())
+        now = datetime.now(_LOCAL_TZ)
         cutoff = now + timedelta(days=self.settings.lookahead_days)
         events: List[AgendaEvent] = []
+        seen_urls = set()
         for source in self.settings.calendars:
-            if not source.url:
+            # The same feed listed twice would be downloaded twice and show duplicate events.
+            if not source.url or source.url in seen_urls:
                 continue
+            seen_urls.add(source.url)
             events.extend(self._fetch_calendar(source, now, cutoff))
-        events.sort(key=lambda item: item.start)
-        return events[: self.settings.max_events]
+        return heapq.nsmallest(self.settings.max_events, events, key=attrgetter("start"))
 
     def _fetch_calendar(
         self,
@@ -45,23 +62,43 @@ class AgendaDataProvider:
         now: datetime,
         cutoff: datetime,
     ) -> List[AgendaEvent]:
+        return [event for event in self._load_events(source.url, now) if now <= event.start <= cutoff]
+
+    def _load_events(self, url: str, now: datetime) -> Tuple[AgendaEvent, ...]:
+        """Return upcoming events for ``url``, revalidating the cached copy when possible."""
+
+        cached = self._feeds.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         try:
-            response = requests.get(source.url, timeout=15)
+            response = session().get(url, headers=headers, timeout=15)
+            if response.status_code == HTTPStatus.NOT_MODIFIED and cached is not None:
+                return cached.events
             response.raise_for_status()
         except requests.RequestException:
-            return []
+            return ()
+
+        # ics (and the arrow/tatsu stack behind it) is slow to import, so it is
+        # only loaded once a calendar actually has to be parsed.
+        from ics import Calendar
 
         try:
             calendar = Calendar(response.text)
         except Exception:
-            return []
+            return ()
 
+        # Past events never become relevant again, so only upcoming ones are kept.
         items: List[AgendaEvent] = []
         for event in calendar.events:
-            start = self._coerce_datetime(event.begin, default_tz=tz.tzlocal())
-            if start is None or start < now or start > cutoff:
+            start = self._coerce_datetime(event.begin, default_tz=_LOCAL_TZ)
+            if start is None or start < now:
                 continue
-            end_dt = self._coerce_datetime(event.end, default_tz=tz.tzlocal()) or start
+            end_dt = self._coerce_datetime(event.end, default_tz=_LOCAL_TZ) or start
             items.append(
                 AgendaEvent(
                     start=start,
@@ -70,7 +107,13 @@ class AgendaDataProvider:
                     location=(event.location or None),
                 )
             )
-        return items
+        events = tuple(items)
+        self._feeds[url] = _CachedFeed(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            events=events,
+        )
+        return events
 
     @staticmethod
     def _coerce_datetime(value, default_tz):
@@ -0,0 +1,16 @@
+"""Shared HTTP session for data providers."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import requests
+
+
+@lru_cache(maxsize=1)
+def session() -> requests.Session:
+    """Return the process-wide session so providers reuse pooled connections."""
+
+    return requests.Session()
+
+
+__all__ = ["session"]
@@ -9,9 +9,12 @@ import requests
 from dateutil import tz
 
 from ..config import MarketSettings
+from .http import session
 
+_LOCAL_TZ = tz.tzlocal()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MarketSnapshot:
     symbol: str
     price: Optional[float]
@@ -48,7 +51,7 @@ class MarketDataProvider:
 
     def _fetch_quote(self) -> Optional[dict]:
         try:
-            response = requests.get(
+            response = session().get(
                 self.QUOTE_ENDPOINT,
                 params={"symbols": self.settings.symbol},
                 timeout=10,
@@ -69,7 +72,7 @@ class MarketDataProvider:
             "includePrePost": "false",
         }
         try:
-            response = requests.get(
+            response = session().get(
                 self.CHART_ENDPOINT.format(symbol=self.settings.symbol),
                 params=params,
                 timeout=10,
@@ -90,7 +93,7 @@ class MarketDataProvider:
     def _parse_timestamp(value: Optional[int]) -> Optional[datetime]:
         if value is None:
             return None
-        return datetime.fromtimestamp(value, tz=tz.tzlocal())
+        return datetime.fromtimestamp(value, tz=_LOCAL_TZ)
 
 
 __all__ = ["MarketDataProvider", "MarketSnapshot"]
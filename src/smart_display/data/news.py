@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from http import HTTPStatus
+from typing import List, Optional
 import time
 
 import feedparser
@@ -11,8 +12,10 @@ from dateutil import tz
 
 from ..config import NewsSettings
 
+_LOCAL_TZ = tz.tzlocal()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class NewsHeadline:
     title: str
     source: str | None
@@ -25,19 +28,27 @@ class NewsDataProvider:
 
     def __init__(self, settings: NewsSettings) -> None:
         self.settings = settings
+        self._etag: Optional[str] = None
+        self._modified: Optional[str] = None
+        self._headlines: List[NewsHeadline] = []
 
     def fetch(self) -> List[NewsHeadline]:
         try:
-            feed = feedparser.parse(self.settings.feed_url)
+            feed = feedparser.parse(
+                self.settings.feed_url,
+                etag=self._etag,
+                modified=self._modified,
+            )
         except Exception:
             return []
+        if feed.get("status") == HTTPStatus.NOT_MODIFIED and self._headlines:
+            return list(self._headlines)
         items: List[NewsHeadline] = []
         for entry in feed.entries[: self.settings.max_items]:
             published = None
-            if getattr(entry, "published_parsed", None):
-                published = datetime.fromtimestamp(
-                    time.mktime(entry.published_parsed), tz=tz.tzlocal()
-                )
+            published_parsed = getattr(entry, "published_parsed", None)
+            if published_parsed:
+                published = datetime.fromtimestamp(time.mktime(published_parsed), tz=_LOCAL_TZ)
             items.append(
                 NewsHeadline(
                     title=getattr(entry, "title", "Untitled"),
@@ -46,6 +57,9 @@ class NewsDataProvider:
                     url=getattr(entry, "link", None),
                 )
             )
+        self._etag = feed.get("etag")
+        self._modified = feed.get("modified")
+        self._headlines = items
         return items
 
 
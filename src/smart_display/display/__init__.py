@@ -2,7 +2,7 @@
 
 from .driver import DisplayDriver
 from .layout import LayoutArea, LayoutManager
-from .style import DEFAULT_PALETTE, Palette, load_font
+from .style import DEFAULT_PALETTE, Palette, default_font, load_font
 
 __all__ = [
     "DEFAULT_PALETTE",
@@ -10,5 +10,6 @@ __all__ = [
     "LayoutArea",
     "LayoutManager",
     "Palette",
+    "default_font",
     "load_font",
 ]
@@ -5,12 +5,15 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from PIL import Image
+from PIL import Image, ImageChops
 
 from ..config import DisplaySettings
 
 _LOGGER = logging.getLogger(__name__)
 
+# The fallback frame is rewritten every cycle; fast deflate matters more than size.
+_FALLBACK_PNG_COMPRESS_LEVEL = 1
+
 
 class DisplayDriver:
     """Encapsulates access to the Inky Impression hardware."""
@@ -19,6 +22,7 @@ class DisplayDriver:
         self.settings = settings
         self._device = None
         self._fallback_path = Path(settings.fallback_image)
+        self._last_frame: Optional[Image.Image] = None
         self._initialise_device()
 
     def _initialise_device(self) -> None:
@@ -38,19 +42,37 @@ class DisplayDriver:
             self._device = None
 
     def show(self, image: Image.Image) -> Path:
-        """Render the image to the Inky panel or save it to disk."""
+        """Render the image to the Inky panel or save it to disk.
+
+        Frames identical to the previous one are skipped, as an e-ink refresh
+        takes tens of seconds and flashes the whole panel.
+        """
+
+        if self._is_unchanged(image):
+            _LOGGER.debug("Frame unchanged; skipping display update")
+            return self._fallback_path
 
         if self._device is not None:  # pragma: no cover - hardware specific
             _LOGGER.debug("Updating Inky display")
             self._device.set_image(image)
             self._device.show()
+            self._last_frame = image
             return self._fallback_path
 
         self._fallback_path.parent.mkdir(parents=True, exist_ok=True)
-        image.save(self._fallback_path)
+        image.save(self._fallback_path, compress_level=_FALLBACK_PNG_COMPRESS_LEVEL)
+        self._last_frame = image
         _LOGGER.info("Saved rendered frame to %s", self._fallback_path)
         return self._fallback_path
 
+    def _is_unchanged(self, image: Image.Image) -> bool:
+        previous = self._last_frame
+        if previous is None or previous.size != image.size or previous.mode != image.mode:
+            return False
+        if self._device is None and not self._fallback_path.exists():
+            return False
+        return ImageChops.difference(previous, image).getbbox() is None
+
     @property
     def device(self) -> Optional[object]:  # pragma: no cover - trivial accessor
         return self._device
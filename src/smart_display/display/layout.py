@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict
 
 from PIL import Image, ImageDraw
@@ -10,7 +11,7 @@ from ..config import DisplaySettings
 from .style import DEFAULT_PALETTE, darken, lighten
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayoutArea:
     """Represents a rectangular area on the canvas."""
 
@@ -90,38 +91,44 @@ class LayoutManager:
     def canvas(self) -> Image.Image:
         """Create a fresh canvas for rendering widgets."""
 
-        width, height = self.settings.width, self.settings.height
-        base = Image.new("RGB", (width, height), color=DEFAULT_PALETTE.background)
-        draw = ImageDraw.Draw(base)
+        return _background(self.settings.width, self.settings.height).copy()
+
+    @property
+    def palette(self):  # pragma: no cover - simple proxy
+        return DEFAULT_PALETTE
+
+
+@lru_cache(maxsize=4)
+def _background(width: int, height: int) -> Image.Image:
+    """Paint the static canvas backdrop once per display size."""
 
-        top_colour = lighten(DEFAULT_PALETTE.background, 0.12)
-        bottom_colour = darken(DEFAULT_PALETTE.background, 0.18)
+    top_colour = lighten(DEFAULT_PALETTE.background, 0.12)
+    bottom_colour = darken(DEFAULT_PALETTE.background, 0.18)
 
-        for y in range(height):
-            blend = y / max(height - 1, 1)
-            colour = tuple(
+    # Build the vertical gradient as a single column and stretch it in one C call.
+    column = Image.new("RGB", (1, height))
+    column.putdata(
+        [
+            tuple(
                 int(top_colour[i] * (1 - blend) + bottom_colour[i] * blend)
                 for i in range(3)
             )
-            draw.line([(0, y), (width, y)], fill=colour)
-
-        highlight = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        highlight_draw = ImageDraw.Draw(highlight)
-        glow_colour = lighten(DEFAULT_PALETTE.accent, 0.35) + (68,)
-        ellipse_bounds = (
-            int(-width * 0.35),
-            int(-height * 0.25),
-            int(width * 0.85),
-            int(height * 0.9),
-        )
-        highlight_draw.ellipse(ellipse_bounds, fill=glow_colour)
-
-        textured = Image.alpha_composite(base.convert("RGBA"), highlight)
-        return textured.convert("RGB")
-
-    @property
-    def palette(self):  # pragma: no cover - simple proxy
-        return DEFAULT_PALETTE
+            for blend in (y / max(height - 1, 1) for y in range(height))
+        ]
+    )
+    base = column.resize((width, height), Image.Resampling.NEAREST)
+
+    # Blend the glow through a single-band mask instead of round-tripping via RGBA.
+    glow_mask = Image.new("L", (width, height), 0)
+    ellipse_bounds = (
+        int(-width * 0.35),
+        int(-height * 0.25),
+        int(width * 0.85),
+        int(height * 0.9),
+    )
+    ImageDraw.Draw(glow_mask).ellipse(ellipse_bounds, fill=68)
+    base.paste(lighten(DEFAULT_PALETTE.accent, 0.35), (0, 0, width, height), glow_mask)
+    return base
 
 
 __all__ = ["LayoutArea", "LayoutManager"]
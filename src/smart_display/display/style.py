@@ -8,7 +8,7 @@ from typing import Tuple
 from PIL import ImageFont
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Palette:
     background: Tuple[int, int, int]
     primary: Tuple[int, int, int]
@@ -30,13 +30,19 @@ DEFAULT_PALETTE = Palette(
 )
 
 
+@lru_cache(maxsize=64)
 def lighten(color: Tuple[int, int, int], amount: float) -> Tuple[int, int, int]:
-    """Return a colour blended towards white by ``amount``."""
+    """Return a colour blended towards white by ``amount``.
+
+    Widgets derive the same handful of shades on every render, so results are
+    memoised; colours must therefore be passed as tuples.
+    """
 
     amount = max(0.0, min(1.0, amount))
     return tuple(int(channel + (255 - channel) * amount) for channel in color)
 
 
+@lru_cache(maxsize=64)
 def darken(color: Tuple[int, int, int], amount: float) -> Tuple[int, int, int]:
     """Return a colour blended towards black by ``amount``."""
 
@@ -56,6 +62,13 @@ def _font_candidates(bold: bool) -> Tuple[str, ...]:
     )
 
 
+@lru_cache(maxsize=1)
+def default_font() -> ImageFont.ImageFont:
+    """Return Pillow's built-in font, parsed once per process."""
+
+    return ImageFont.load_default()
+
+
 @lru_cache(maxsize=16)
 def load_font(size: int, *, bold: bool = False) -> ImageFont.FreeTypeFont:
     """Load a truetype font with graceful fallback."""
@@ -65,7 +78,32 @@ def load_font(size: int, *, bold: bool = False) -> ImageFont.FreeTypeFont:
             return ImageFont.truetype(path, size=size)
         except OSError:
             continue
-    return ImageFont.load_default()
+    return default_font()
+
+
+@lru_cache(maxsize=32)
+def text_height(font: ImageFont.ImageFont) -> int:
+    """Return the line height of ``font``, measured once per font."""
+
+    bbox = font.getbbox("Hg")
+    return bbox[3] - bbox[1]
+
+
+@lru_cache(maxsize=256)
+def text_width(font: ImageFont.ImageFont, text: str) -> int:
+    """Return the rendered width of ``text`` in ``font``, memoised across refreshes."""
+
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
 
 
-__all__ = ["DEFAULT_PALETTE", "load_font", "Palette", "lighten", "darken"]
+__all__ = [
+    "DEFAULT_PALETTE",
+    "default_font",
+    "load_font",
+    "Palette",
+    "lighten",
+    "darken",
+    "text_height",
+    "text_width",
+]
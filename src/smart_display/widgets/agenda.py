@@ -8,7 +8,7 @@ from PIL import Image, ImageDraw
 
 from ..config import AgendaSettings
 from ..data.agenda import AgendaDataProvider, AgendaEvent
-from ..display.style import lighten, load_font
+from ..display.style import lighten, load_font, text_height, text_width
 from .base import Widget, WidgetContext
 
 
@@ -55,7 +55,7 @@ class AgendaWidget(Widget[List[AgendaEvent]]):
             fill=palette.primary,
             font=header_font,
         )
-        y = header_y + _text_height(header_font) + 12
+        y = header_y + text_height(header_font) + 12
         draw.line(
             [(area.left, y), (area.right, y)],
             fill=lighten(palette.muted, 0.1),
@@ -67,28 +67,37 @@ class AgendaWidget(Widget[List[AgendaEvent]]):
             draw.text((area.left, y), "NO UPCOMING EVENTS", fill=palette.secondary, font=sub_font)
             return
 
+        badge_height = text_height(body_font) + 18
+        badge_fill = lighten(palette.accent, 0.15)
         current_day = None
         for event in data:
+            # Measure the whole entry first so nothing is drawn past the bottom of the card.
             event_day = event.start.date()
-            if current_day != event_day:
+            new_day = current_day != event_day
+            label_height = text_height(sub_font) + 10 if new_day else 0
+            text_block = 4 + text_height(body_font)
+            if event.location:
+                text_block += 6 + text_height(detail_font)
+            if y + label_height + max(badge_height, text_block) > area.bottom:
+                break
+
+            if new_day:
                 current_day = event_day
                 day_label = event.start.strftime("%A, %d %B")
                 draw.text((area.left, y), day_label.upper(), fill=palette.secondary, font=sub_font)
-                y += _text_height(sub_font) + 10
+                y += label_height
 
             time_range = _format_time_range(event, context.now)
-            badge_height = _text_height(body_font) + 18
-            badge_width = _text_width(body_font, time_range) + 32
+            badge_width = text_width(body_font, time_range) + 32
             badge_bottom = y + badge_height
 
-            badge_fill = lighten(palette.accent, 0.15)
             draw.rounded_rectangle(
                 [area.left, y, area.left + badge_width, badge_bottom],
                 radius=badge_height // 2,
                 fill=badge_fill,
             )
             draw.text(
-                (area.left + 16, y + (badge_height - _text_height(body_font)) // 2),
+                (area.left + 16, y + (badge_height - text_height(body_font)) // 2),
                 time_range,
                 fill=(255, 255, 255),
                 font=body_font,
@@ -101,7 +110,7 @@ class AgendaWidget(Widget[List[AgendaEvent]]):
                 fill=palette.primary,
                 font=body_font,
             )
-            text_bottom = y + 4 + _text_height(body_font)
+            text_bottom = y + 4 + text_height(body_font)
             if event.location:
                 location_y = text_bottom + 6
                 draw.text(
@@ -110,35 +119,20 @@ class AgendaWidget(Widget[List[AgendaEvent]]):
                     fill=lighten(palette.secondary, 0.12),
                     font=detail_font,
                 )
-                text_bottom = location_y + _text_height(detail_font)
+                text_bottom = location_y + text_height(detail_font)
 
             y = max(badge_bottom, text_bottom) + 20
-            if y > area.bottom - _text_height(body_font):
-                break
-
-
-def _text_height(font) -> int:
-    bbox = font.getbbox("Hg")
-    return bbox[3] - bbox[1]
-
-
-def _text_width(font, text: str) -> int:
-    bbox = font.getbbox(text)
-    return bbox[2] - bbox[0]
 
 
 def _format_time_range(event: AgendaEvent, now: datetime) -> str:
     start_fmt = event.start.strftime("%H:%M")
-    if event.start.date() != event.end.date():
-        end_fmt = event.end.strftime("%d %b %H:%M")
-    else:
-        end_fmt = event.end.strftime("%H:%M")
     if event.end <= event.start:
         return start_fmt
-    if event.start.date() == now.date():
-        return f"{start_fmt} - {end_fmt}"
-    day = event.start.strftime("%d %b")
-    return f"{day} {start_fmt}"
+    start_day = event.start.date()
+    if start_day != now.date():
+        return event.start.strftime("%d %b %H:%M")
+    end_pattern = "%H:%M" if event.end.date() == start_day else "%d %b %H:%M"
+    return f"{start_fmt} - {event.end.strftime(end_pattern)}"
 
 
 __all__ = ["AgendaWidget"]
@@ -9,12 +9,12 @@ from typing import Generic, Optional, TypeVar
 from PIL import Image, ImageDraw
 
 from ..display.layout import LayoutArea
-from ..display.style import Palette
+from ..display.style import Palette, default_font
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetContext:
     """Context available during rendering."""
 
@@ -39,26 +39,40 @@ class Widget(ABC, Generic[T]):
     def draw(self, image: Image.Image, draw: ImageDraw.ImageDraw, context: WidgetContext, data: T) -> None:
         """Render the widget into the provided drawing context."""
 
+    def refresh(self) -> Optional[T]:
+        """Fetch new data, falling back to the last successful result."""
+
+        data = self.fetch()
+        if data is not None:
+            self._last_data = data
+        return self._last_data
+
     def render(self, image: Image.Image, context: WidgetContext) -> None:
         """Fetch data and render the widget."""
 
         if not self.enabled:
             return
-        data = self.fetch()
-        if data is None:
-            if self._last_data is not None:
-                data = self._last_data
-            else:
-                self.draw_placeholder(image, context)
-                return
-        self._last_data = data
+        self.render_data(image, context, self.refresh())
+
+    def render_data(self, image: Image.Image, context: WidgetContext, data: Optional[T]) -> None:
+        """Render previously fetched data, or a placeholder when there is none."""
+
         draw = ImageDraw.Draw(image)
+        if data is None:
+            self.draw_placeholder(image, context, draw)
+            return
         self.draw(image, draw, context, data)
 
-    def draw_placeholder(self, image: Image.Image, context: WidgetContext) -> None:
+    def draw_placeholder(
+        self,
+        image: Image.Image,
+        context: WidgetContext,
+        draw: Optional[ImageDraw.ImageDraw] = None,
+    ) -> None:
         """Render a neutral placeholder when data is unavailable."""
 
-        draw = ImageDraw.Draw(image)
+        if draw is None:
+            draw = ImageDraw.Draw(image)
         area = context.area.inset(20, 20)
         draw.rectangle(
             [area.left, area.top, area.right, area.bottom],
@@ -70,6 +84,7 @@ class Widget(ABC, Generic[T]):
             (area.left + 10, area.top + 10),
             "No data",
             fill=context.palette.muted,
+            font=default_font(),
         )
 
 
@@ -13,12 +13,16 @@ from .base import Widget
 def build_widgets(config: AppConfig) -> Dict[str, Widget]:
     """Instantiate widgets for the supplied configuration."""
 
-    widgets: Dict[str, Widget] = {
-        "agenda": AgendaWidget(config.agenda),
-        "news": NewsWidget(config.news),
-        "market": MarketWidget(config.market),
+    candidates = (
+        ("agenda", AgendaWidget, config.agenda),
+        ("news", NewsWidget, config.news),
+        ("market", MarketWidget, config.market),
+    )
+    return {
+        key: widget_cls(settings)
+        for key, widget_cls, settings in candidates
+        if settings.enabled
     }
-    return {key: widget for key, widget in widgets.items() if widget.enabled}
 
 
 __all__ = ["build_widgets"]
@@ -7,7 +7,7 @@ from PIL import Image, ImageDraw
 
 from ..config import MarketSettings
 from ..data.market import MarketDataProvider, MarketSnapshot
-from ..display.style import darken, lighten, load_font
+from ..display.style import darken, lighten, load_font, text_height
 from .base import Widget, WidgetContext
 
 
@@ -44,29 +44,29 @@ class MarketWidget(Widget[MarketSnapshot]):
 
         y = area.top
         draw.text((area.left, y), "MARKET OVERVIEW", fill=palette.primary, font=label_font)
-        y += _text_height(label_font) + 12
+        y += text_height(label_font) + 12
         draw.line([(area.left, y), (area.right, y)], fill=lighten(palette.muted, 0.1), width=2)
         y += 16
 
         draw.text((area.left, y), data.symbol, fill=palette.secondary, font=symbol_font)
-        y += _text_height(symbol_font) + 10
+        y += text_height(symbol_font) + 10
 
         price_text = _format_price(data)
         draw.text((area.left, y), price_text, fill=palette.primary, font=price_font)
-        y += _text_height(price_font) + 6
+        y += text_height(price_font) + 6
 
         change_text, change_colour = _format_change(data, palette)
         draw.text((area.left, y), change_text, fill=change_colour, font=meta_font)
-        y += _text_height(meta_font) + 20
+        y += text_height(meta_font) + 20
 
-        timestamp_height = _text_height(meta_font) + 12 if data.last_updated else 0
+        timestamp_height = text_height(meta_font) + 12 if data.last_updated else 0
         spark_area = (area.left, y, area.right, area.bottom - timestamp_height)
         _draw_sparkline(draw, spark_area, data.history, palette)
 
         if data.last_updated:
             timestamp = data.last_updated.strftime("Updated %H:%M")
             draw.text(
-                (area.left, area.bottom - _text_height(meta_font)),
+                (area.left, area.bottom - text_height(meta_font)),
                 timestamp,
                 fill=lighten(palette.muted, 0.15),
                 font=meta_font,
@@ -138,9 +138,4 @@ def _format_change(snapshot: MarketSnapshot, palette) -> tuple[str, tuple[int, i
     return f"{sign}{change:.2f} ({sign}{percent:.2f}%)", colour
 
 
-def _text_height(font) -> int:
-    bbox = font.getbbox("Hg")
-    return bbox[3] - bbox[1]
-
-
 __all__ = ["MarketWidget"]
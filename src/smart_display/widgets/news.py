@@ -8,7 +8,7 @@ from PIL import Image, ImageDraw
 
 from ..config import NewsSettings
 from ..data.news import NewsDataProvider, NewsHeadline
-from ..display.style import darken, lighten, load_font
+from ..display.style import darken, lighten, load_font, text_height, text_width
 from .base import Widget, WidgetContext
 
 
@@ -45,7 +45,7 @@ class NewsWidget(Widget[List[NewsHeadline]]):
 
         y = area.top
         draw.text((area.left, y), "TOP STORIES", fill=palette.primary, font=header_font)
-        y += _text_height(header_font) + 10
+        y += text_height(header_font) + 10
         draw.line([(area.left, y), (area.right, y)], fill=lighten(palette.muted, 0.1), width=2)
         y += 14
 
@@ -60,15 +60,15 @@ class NewsWidget(Widget[List[NewsHeadline]]):
             kicker = headline.source.upper() if headline.source else None
             if kicker:
                 kicker_bg = darken(palette.accent, 0.2)
-                kicker_height = _text_height(kicker_font) + 10
-                kicker_width = _text_width(kicker_font, kicker) + 18
+                kicker_height = text_height(kicker_font) + 10
+                kicker_width = text_width(kicker_font, kicker) + 18
                 draw.rounded_rectangle(
                     [area.left, item_bottom, area.left + kicker_width, item_bottom + kicker_height],
                     radius=8,
                     fill=kicker_bg,
                 )
                 draw.text(
-                    (area.left + 9, item_bottom + (kicker_height - _text_height(kicker_font)) // 2),
+                    (area.left + 9, item_bottom + (kicker_height - text_height(kicker_font)) // 2),
                     kicker,
                     fill=palette.primary,
                     font=kicker_font,
@@ -81,19 +81,19 @@ class NewsWidget(Widget[List[NewsHeadline]]):
                 fill=palette.primary,
                 font=body_font,
             )
-            item_bottom += _text_height(body_font)
+            item_bottom += text_height(body_font)
 
             meta = _format_metadata(headline, context.now)
             if meta:
-                badge_width = _text_width(meta_font, meta) + 20
-                badge_height = _text_height(meta_font) + 12
+                badge_width = text_width(meta_font, meta) + 20
+                badge_height = text_height(meta_font) + 12
                 draw.rounded_rectangle(
                     [area.left, item_bottom + 6, area.left + badge_width, item_bottom + 6 + badge_height],
                     radius=badge_height // 2,
                     fill=darken(palette.secondary, 0.35),
                 )
                 draw.text(
-                    (area.left + 10, item_bottom + 6 + (badge_height - _text_height(meta_font)) // 2),
+                    (area.left + 10, item_bottom + 6 + (badge_height - text_height(meta_font)) // 2),
                     meta,
                     fill=(255, 255, 255),
                     font=meta_font,
@@ -101,22 +101,12 @@ class NewsWidget(Widget[List[NewsHeadline]]):
                 item_bottom += badge_height + 12
 
             y = item_bottom + 18
-            if idx < len(data) - 1 and y < area.bottom - _text_height(body_font):
+            if idx < len(data) - 1 and y < area.bottom - text_height(body_font):
                 draw.line([(area.left, y - 8), (area.right, y - 8)], fill=tuple(min(255, c + 45) for c in palette.muted), width=1)
-            if y > area.bottom - _text_height(body_font):
+            if y > area.bottom - text_height(body_font):
                 break
 
 
-def _text_height(font) -> int:
-    bbox = font.getbbox("Hg")
-    return bbox[3] - bbox[1]
-
-
-def _text_width(font, text: str) -> int:
-    bbox = font.getbbox(text)
-    return bbox[2] - bbox[0]
-
-
 def _format_metadata(headline: NewsHeadline, now: datetime) -> str:
     bits: List[str] = []
     if headline.source:
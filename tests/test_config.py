@@ -1,3 +1,6 @@
+import json
+import os
+
 from smart_display.config import AppConfig, CalendarSource, ConfigManager
 
 
@@ -16,3 +19,31 @@ def test_load_and_update(tmp_path):
 
     manager.update({"refresh_minutes": 5})
     assert manager.load().refresh_minutes == 5
+
+
+def test_load_picks_up_external_edits(tmp_path):
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(config_path)
+    assert manager.load().refresh_minutes == 15
+    assert manager.load().refresh_minutes == 15
+
+    data = json.loads(config_path.read_text(encoding="utf-8"))
+    data["refresh_minutes"] = 30
+    config_path.write_text(json.dumps(data), encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert manager.load().refresh_minutes == 30
+
+
+def test_noop_update_skips_write(tmp_path):
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(config_path)
+    manager.load()
+    config_path.write_text(config_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    before = config_path.read_text(encoding="utf-8")
+
+    manager.update({})
+    manager.update({"refresh_minutes": 15})
+
+    assert config_path.read_text(encoding="utf-8") == before
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import feedparser
+import pytest
+
+from smart_display.config import AgendaSettings, CalendarSource, NewsSettings
+from smart_display.data import agenda, news
+from smart_display.data.agenda import AgendaDataProvider
+from smart_display.data.news import NewsDataProvider
+
+
+def test_news_reuses_headlines_when_feed_not_modified(monkeypatch):
+    calls = []
+
+    def fake_parse(url, etag=None, modified=None):
+        calls.append(etag)
+        if etag:
+            return feedparser.FeedParserDict(status=304, entries=[])
+        entry = feedparser.FeedParserDict(title="Hello", link="https://example.com")
+        return feedparser.FeedParserDict(status=200, etag='"v1"', entries=[entry])
+
+    monkeypatch.setattr(news.feedparser, "parse", fake_parse)
+    provider = NewsDataProvider(NewsSettings())
+
+    assert [item.title for item in provider.fetch()] == ["Hello"]
+    assert [item.title for item in provider.fetch()] == ["Hello"]
+    assert calls == [None, '"v1"']
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(dict(headers or {}))
+        status, response_headers, text = self.responses.pop(0)
+        return SimpleNamespace(
+            status_code=status,
+            headers=response_headers,
+            text=text,
+            raise_for_status=lambda: None,
+        )
+
+
+def test_agenda_revalidates_cached_feed(monkeypatch):
+    ics = pytest.importorskip("ics")
+    now = datetime(2026, 10, 16, 8, 0, tzinfo=agenda._LOCAL_TZ)
+    offsets = {"Soon": timedelta(hours=1), "Later": timedelta(days=2), "Far": timedelta(days=5)}
+    feed_events = [
+        SimpleNamespace(begin=now + offset, end=None, name=name, location=None)
+        for name, offset in offsets.items()
+    ]
+
+    class FakeCalendar:
+        def __init__(self, text):
+            self.events = feed_events if text else []
+
+    fake_session = FakeSession(
+        [
+            (200, {"ETag": '"v1"', "Last-Modified": "Fri, 16 Oct 2026 06:00:00 GMT"}, "BEGIN:VCALENDAR"),
+            (304, {}, ""),
+            (304, {}, ""),
+        ]
+    )
+    monkeypatch.setattr(ics, "Calendar", FakeCalendar)
+    monkeypatch.setattr(agenda, "session", lambda: fake_session)
+    provider = AgendaDataProvider(AgendaSettings())
+    source = CalendarSource(name="Home", url="https://example.com/home.ics")
+
+    first = provider._fetch_calendar(source, now, now + timedelta(days=3))
+    assert [event.title for event in first] == ["Soon", "Later"]
+
+    # A few hours on, "Soon" has passed and the cached feed must be re-filtered.
+    later = now + timedelta(hours=3)
+    second = provider._fetch_calendar(source, later, later + timedelta(days=3))
+    assert [event.title for event in second] == ["Later"]
+    assert fake_session.sent_headers[0] == {}
+    assert fake_session.sent_headers[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Fri, 16 Oct 2026 06:00:00 GMT",
+    }
+
+    # A 304 for a feed that was never cached must not surface another feed's events.
+    other = CalendarSource(name="Work", url="https://example.com/work.ics")
+    assert provider._fetch_calendar(other, later, later + timedelta(days=3)) == []
+    assert fake_session.sent_headers[2] == {}
@@ -0,0 +1,18 @@
+from PIL import Image
+
+from smart_display.config import DisplaySettings
+from smart_display.display.driver import DisplayDriver
+
+
+def test_unchanged_frame_is_not_rewritten(tmp_path):
+    output = tmp_path / "latest.png"
+    driver = DisplayDriver(DisplaySettings(enable_hardware=False, fallback_image=str(output)))
+
+    driver.show(Image.new("RGB", (10, 10), "white"))
+    output.write_bytes(b"sentinel")
+
+    driver.show(Image.new("RGB", (10, 10), "white"))
+    assert output.read_bytes() == b"sentinel"
+
+    driver.show(Image.new("RGB", (10, 10), "black"))
+    assert output.read_bytes() != b"sentinel"
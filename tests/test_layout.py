@@ -22,3 +22,13 @@ def test_layout_areas_cover_display():
 
     assert news.bottom == market.bottom
     assert agenda.right == market.right
+
+
+def test_canvas_returns_independent_copies():
+    layout = LayoutManager(DisplaySettings(width=80, height=48))
+
+    first = layout.canvas()
+    expected = first.getpixel((0, 0))
+    first.putpixel((0, 0), (255, 0, 0))
+
+    assert layout.canvas().getpixel((0, 0)) == expected
@@ -35,3 +35,21 @@ def test_build_widgets_respects_disabled():
     widgets = build_widgets(config)
     assert "news" not in widgets
     assert "agenda" in widgets
+
+
+class FlakyWidget(Widget[str]):
+    def __init__(self, responses):
+        super().__init__("flaky")
+        self._responses = list(responses)
+
+    def fetch(self):
+        return self._responses.pop(0)
+
+    def draw(self, image, draw, context, data):
+        draw.text((0, 0), data, fill=(0, 0, 0))
+
+
+def test_refresh_falls_back_to_last_good_data():
+    widget = FlakyWidget(["first", None])
+    assert widget.refresh() == "first"
+    assert widget.refresh() == "first"